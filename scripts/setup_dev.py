@@ -5,20 +5,35 @@ Setup script for MAXINE development environment.
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 
-def run_command(cmd: list, description: str) -> bool:
-    """Run a command and return success status."""
+def run_command(
+    cmd: list, description: str, stream: bool = False, cwd: Optional[Path] = None
+) -> bool:
+    """Run a command and return success status.
+
+    With ``stream`` the output goes straight to the terminal instead of being
+    buffered, which suits long-running steps.
+    """
     print(f"🔧 {description}...")
     try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
+        if stream:
+            subprocess.run(cmd, check=True, cwd=cwd)
+        else:
+            subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=cwd)
         print(f"✅ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} failed:")
-        print(f"   Command: {' '.join(cmd)}")
-        print(f"   Error: {e.stderr}")
+    except (subprocess.CalledProcessError, OSError) as e:
+        # Report in one write so parallel checks don't interleave their output
+        report = [f"❌ {description} failed:", f"   Command: {' '.join(cmd)}"]
+        if isinstance(e, OSError):
+            report.append(f"   Error: {e}")
+        elif not stream:
+            report.append(f"   Error: {e.stderr}")
+        sys.stdout.write("\n".join(report) + "\n")
         return False
 
 
@@ -29,32 +44,51 @@ def main():
 
     project_root = Path(__file__).parent.parent
 
-    # Check if poetry is available
-    if not run_command(["poetry", "--version"], "Checking Poetry installation"):
+    # Check the Poetry installation and project configuration in parallel
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        poetry_ok = executor.submit(
+            run_command, ["poetry", "--version"], "Checking Poetry installation"
+        )
+        config_ok = executor.submit(
+            run_command, ["poetry", "check"], "Checking project configuration"
+        )
+
+    if not poetry_ok.result():
         print("❌ Poetry is not installed. Please install Poetry first:")
         print("   https://python-poetry.org/docs/#installation")
         return 1
 
+    if not config_ok.result():
+        return 1
+
     # Install dependencies
-    if not run_command(["poetry", "install"], "Installing dependencies"):
+    if not run_command(["poetry", "install"], "Installing dependencies", stream=True):
         return 1
 
     # Install pre-commit hooks
     if not run_command(
-        ["poetry", "run", "pre-commit", "install"], "Installing pre-commit hooks"
+        [
+            "poetry",
+            "run",
+            "pre-commit",
+            "install",
+            "--hook-type",
+            "pre-commit",
+            "--hook-type",
+            "pre-push",
+        ],
+        "Installing pre-commit hooks",
     ):
         return 1
 
-    # Run pre-commit on all files to ensure everything works
-    print("🔍 Running initial pre-commit check...")
-    try:
-        subprocess.run(
-            ["poetry", "run", "pre-commit", "run", "--all-files"],
-            check=False,  # Don't fail if there are issues, just report
-            cwd=project_root,
-        )
-        print("✅ Pre-commit setup completed")
-    except subprocess.CalledProcessError:
+    # Run pre-commit on all files to ensure everything works.
+    # Don't fail if there are issues, just report
+    if not run_command(
+        ["poetry", "run", "pre-commit", "run", "--all-files"],
+        "Running initial pre-commit check",
+        stream=True,
+        cwd=project_root,
+    ):
         print(
             "⚠️  Pre-commit found issues. Run 'poetry run pre-commit run --all-files' to see details."
         )